@@ -1,6 +1,29 @@
 import streamlit as st
+import functools
 import json
+import string
+import sys
 import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field, asdict
+from enum import IntEnum
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Fastest available JSON parser: orjson, then ujson, then stdlib
+if orjson is not None:
+    _loads = orjson.loads
+elif ujson is not None:
+    _loads = ujson.loads
+else:
+    _loads = json.loads
 from typing import Dict, List, Any
 import pandas as pd
 from datetime import datetime
@@ -15,7 +38,9 @@ st.set_page_config(
 )
 
 # Custom CSS for drag and drop styling
-st.markdown("""
+@st.cache_data
+def _css_block() -> str:
+    return """
 <style>
 .workflow-canvas {
     background: linear-gradient(90deg, #f0f2f6 1px, transparent 1px),
@@ -91,62 +116,149 @@ st.markdown("""
 .status-error { background-color: #dc3545; }
 .status-pending { background-color: #6c757d; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_data
+def _welcome_html() -> str:
+    return """
+<div class="workflow-canvas">
+    <div style="text-align: center; color: #666; margin-top: 200px;">
+        <h3>👋 Welcome to Workflow Builder!</h3>
+        <p>Start by adding elements from the sidebar to create your workflow.</p>
+        <p>Elements will appear here and can be configured individually.</p>
+    </div>
+</div>
+"""
+
+st.markdown(_css_block(), unsafe_allow_html=True)
+
+# Palette entries and display names, built once at import time
+ELEMENT_TYPES = {
+    "📄 PDF Upload": "pdf_upload",
+    "📝 Text Input": "text_input",
+    "🔢 Number Input": "number_input",
+    "📅 Date Input": "date_input",
+    "☑️ Checkbox": "checkbox",
+    "🎛️ Slider": "slider",
+    "📋 Select Box": "selectbox",
+    "🔀 Conditional": "conditional",
+    "🔄 Loop": "loop",
+    "📊 Data Display": "data_display",
+    "📈 Chart": "chart",
+    "💾 Save Data": "save_data",
+    "🔗 API Call": "api_call",
+    "📧 Email": "email",
+    "⏱️ Timer": "timer"
+}
+
+ELEMENT_DISPLAY_NAMES = {
+    'pdf_upload': 'PDF Upload',
+    'text_input': 'Text Input',
+    'number_input': 'Number Input',
+    'date_input': 'Date Input',
+    'checkbox': 'Checkbox',
+    'slider': 'Slider',
+    'selectbox': 'Select Box',
+    'conditional': 'Conditional Logic',
+    'loop': 'Loop',
+    'data_display': 'Data Display',
+    'chart': 'Chart',
+    'save_data': 'Save Data',
+    'api_call': 'API Call',
+    'email': 'Email',
+    'timer': 'Timer'
+}
 
-# Initialize session state
+# Maximum number of elements rendered in full on the canvas at once;
+# larger workflows show lightweight placeholders outside this window
+CANVAS_WINDOW = 25
+
+# Element types whose execution simply passes their configured value through
+PASSTHROUGH_TYPES = frozenset({'text_input', 'number_input', 'date_input', 'checkbox', 'slider', 'selectbox'})
+
+# Initialize session state. Elements live in a dict keyed by element id
+# with a separate id list holding the canvas order: deletion and by-id
+# lookup are O(1) and widget keys stay stable across deletions.
 if 'workflow_elements' not in st.session_state:
-    st.session_state.workflow_elements = []
+    st.session_state.workflow_elements = {}
+if 'workflow_order' not in st.session_state:
+    st.session_state.workflow_order = []
 if 'workflow_data' not in st.session_state:
     st.session_state.workflow_data = {}
 if 'execution_results' not in st.session_state:
     st.session_state.execution_results = {}
+if 'focus_index' not in st.session_state:
+    st.session_state.focus_index = 0
+
+class Status(IntEnum):
+    PENDING = 0
+    READY = 1
+    PROCESSING = 2
+    ERROR = 3
+
+
+# CSS class per status, indexed by the Status value
+STATUS_CSS = ('status-pending', 'status-ready', 'status-processing', 'status-error')
+
+# Opening markup for an element card, compiled once; only the display
+# name and status class vary per element
+_ELEMENT_HTML_TPL = string.Template(
+    '<div class="workflow-element">'
+    '<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">'
+    '<h4>🔧 $name</h4>'
+    '<span class="status-indicator $css"></span>'
+    '</div>'
+)
+
 
+def _coerce_status(value) -> Status:
+    """Convert an imported status (int or legacy string) to a Status"""
+    if isinstance(value, str):
+        try:
+            return Status[value.upper()]
+        except KeyError:
+            return Status.PENDING
+    try:
+        return Status(value)
+    except (ValueError, TypeError):
+        return Status.PENDING
+
+
+@functools.cache
+def _wkey(prefix: str, element_id: str) -> str:
+    """Widget key for an element, built and interned once per (prefix, id)"""
+    return sys.intern(f"{prefix}_{element_id}")
+
+
+# Pool of pre-generated element ids; uuid.uuid4() reads from the OS
+# entropy source, so generate in batches rather than one call per element
+_uuid_pool: deque = deque()
+
+def _next_uuid() -> str:
+    if not _uuid_pool:
+        _uuid_pool.extend(str(uuid.uuid4()) for _ in range(32))
+    return _uuid_pool.popleft()
+
+
+@dataclass(slots=True)
 class WorkflowElement:
-    def __init__(self, element_type: str, element_id: str = None):
-        self.id = element_id or str(uuid.uuid4())
-        self.type = element_type
-        self.position = {'x': 0, 'y': 0}
-        self.config = {}
-        self.status = 'pending'
-        self.output = None
-        
+    type: str
+    id: str = field(default_factory=_next_uuid)
+    position: Dict[str, int] = field(default_factory=lambda: {'x': 0, 'y': 0})
+    config: Dict[str, Any] = field(default_factory=dict)
+    status: Status = Status.PENDING
+    output: Any = None
+
     def to_dict(self):
-        return {
-            'id': self.id,
-            'type': self.type,
-            'position': self.position,
-            'config': self.config,
-            'status': self.status,
-            'output': self.output
-        }
+        return asdict(self)
 
 def create_element_palette():
     """Create the element palette sidebar"""
     st.sidebar.header("🧰 Element Palette")
-    
-    element_types = {
-        "📄 PDF Upload": "pdf_upload",
-        "📝 Text Input": "text_input",
-        "🔢 Number Input": "number_input",
-        "📅 Date Input": "date_input",
-        "☑️ Checkbox": "checkbox",
-        "🎛️ Slider": "slider",
-        "📋 Select Box": "selectbox",
-        "🔀 Conditional": "conditional",
-        "🔄 Loop": "loop",
-        "📊 Data Display": "data_display",
-        "📈 Chart": "chart",
-        "💾 Save Data": "save_data",
-        "🔗 API Call": "api_call",
-        "📧 Email": "email",
-        "⏱️ Timer": "timer"
-    }
-    
-    st.sidebar.markdown("**Click to add elements to workflow:**")
-    
-    for display_name, element_type in element_types.items():
-        if st.sidebar.button(display_name, key=f"add_{element_type}"):
-            add_element_to_workflow(element_type)
+
+    choice = st.sidebar.selectbox("Element type", list(ELEMENT_TYPES.keys()), key="palette_choice")
+    if st.sidebar.button("➕ Add to workflow", key="palette_add"):
+        add_element_to_workflow(ELEMENT_TYPES[choice])
     
     st.sidebar.markdown("---")
     
@@ -159,7 +271,8 @@ def create_element_palette():
             execute_workflow()
     with col2:
         if st.button("🗑️ Clear", key="clear_workflow"):
-            st.session_state.workflow_elements = []
+            st.session_state.workflow_elements = {}
+            st.session_state.workflow_order = []
             st.session_state.workflow_data = {}
             st.session_state.execution_results = {}
             st.rerun()
@@ -173,9 +286,12 @@ def create_element_palette():
 
 def add_element_to_workflow(element_type: str):
     """Add a new element to the workflow"""
-    element = WorkflowElement(element_type)
-    element.position = {'x': len(st.session_state.workflow_elements) * 100, 'y': 50}
-    st.session_state.workflow_elements.append(element)
+    element = WorkflowElement(
+        type=element_type,
+        position={'x': len(st.session_state.workflow_order) * 100, 'y': 50}
+    )
+    st.session_state.workflow_elements[element.id] = element
+    st.session_state.workflow_order.append(element.id)
     st.rerun()
 
 def render_workflow_canvas():
@@ -183,48 +299,67 @@ def render_workflow_canvas():
     st.header("🔧 Workflow Builder")
     
     if not st.session_state.workflow_elements:
-        st.markdown("""
-        <div class="workflow-canvas">
-            <div style="text-align: center; color: #666; margin-top: 200px;">
-                <h3>👋 Welcome to Workflow Builder!</h3>
-                <p>Start by adding elements from the sidebar to create your workflow.</p>
-                <p>Elements will appear here and can be configured individually.</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_welcome_html(), unsafe_allow_html=True)
     else:
+        order = st.session_state.workflow_order
+        total = len(order)
+
+        # Window the canvas: only CANVAS_WINDOW elements around the focus
+        # are rendered in full, so widget count stays bounded however
+        # large the workflow grows
+        if total > CANVAS_WINDOW:
+            focus = st.number_input(
+                "Focused element",
+                min_value=1,
+                max_value=total,
+                value=min(st.session_state.focus_index + 1, total),
+                key="canvas_focus",
+                help=f"Workflows over {CANVAS_WINDOW} elements render a window around this element"
+            ) - 1
+            st.session_state.focus_index = focus
+            start = max(0, focus - CANVAS_WINDOW // 2)
+            end = min(total, start + CANVAS_WINDOW)
+            start = max(0, end - CANVAS_WINDOW)
+        else:
+            start, end = 0, total
+
         with st.container():
             st.markdown('<div class="workflow-canvas">', unsafe_allow_html=True)
-            
-            for i, element in enumerate(st.session_state.workflow_elements):
-                render_workflow_element(element, i)
-                
+
+            for i, element_id in enumerate(order):
+                if start <= i < end:
+                    render_workflow_element(element_id, i)
+                else:
+                    element = st.session_state.workflow_elements[element_id]
+                    st.markdown(f"▫ {i + 1}. {get_element_display_name(element.type)}")
+
                 # Add connector between elements (except for the last one)
-                if i < len(st.session_state.workflow_elements) - 1:
+                if i < total - 1:
                     st.markdown('<div class="workflow-connector"></div>', unsafe_allow_html=True)
-            
+
             st.markdown('</div>', unsafe_allow_html=True)
 
-def render_workflow_element(element: WorkflowElement, index: int):
-    """Render individual workflow element"""
-    status_colors = {
-        'pending': 'status-pending',
-        'ready': 'status-ready',
-        'processing': 'status-processing',
-        'error': 'status-error'
-    }
-    
+@st.fragment
+def render_workflow_element(element_id: str, index: int):
+    """Render individual workflow element
+
+    Runs as a fragment so editing one element's config reruns only this
+    element's subtree instead of the whole canvas.
+    """
+    # Re-read by id so fragment reruns see up-to-date session state
+    element = st.session_state.workflow_elements[element_id]
+
     with st.container():
         col1, col2, col3 = st.columns([0.1, 0.8, 0.1])
-        
+
         with col2:
-            st.markdown(f"""
-            <div class="workflow-element">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
-                    <h4>🔧 {get_element_display_name(element.type)}</h4>
-                    <span class="status-indicator {status_colors.get(element.status, 'status-pending')}"></span>
-                </div>
-            """, unsafe_allow_html=True)
+            st.markdown(
+                _ELEMENT_HTML_TPL.substitute(
+                    name=get_element_display_name(element.type),
+                    css=STATUS_CSS[int(element.status)]
+                ),
+                unsafe_allow_html=True
+            )
             
             # Render element-specific configuration
             render_element_config(element, index)
@@ -232,232 +367,271 @@ def render_workflow_element(element: WorkflowElement, index: int):
             # Element actions
             col_config, col_delete = st.columns([3, 1])
             with col_delete:
-                if st.button("🗑️", key=f"delete_{element.id}", help="Delete element"):
-                    st.session_state.workflow_elements.pop(index)
-                    st.rerun()
+                if st.button("🗑️", key=_wkey('delete', element.id), help="Delete element"):
+                    st.session_state.workflow_order.remove(element.id)
+                    del st.session_state.workflow_elements[element.id]
+                    # Deletion changes the canvas layout, so escape the
+                    # fragment and rerun the full app
+                    st.rerun(scope="app")
             
             st.markdown('</div>', unsafe_allow_html=True)
 
 def get_element_display_name(element_type: str) -> str:
     """Get display name for element type"""
-    names = {
-        'pdf_upload': 'PDF Upload',
-        'text_input': 'Text Input',
-        'number_input': 'Number Input',
-        'date_input': 'Date Input',
-        'checkbox': 'Checkbox',
-        'slider': 'Slider',
-        'selectbox': 'Select Box',
-        'conditional': 'Conditional Logic',
-        'loop': 'Loop',
-        'data_display': 'Data Display',
-        'chart': 'Chart',
-        'save_data': 'Save Data',
-        'api_call': 'API Call',
-        'email': 'Email',
-        'timer': 'Timer'
+    return ELEMENT_DISPLAY_NAMES.get(element_type, element_type.title())
+
+def _render_pdf_upload(element: WorkflowElement, index: int):
+    st.write("📄 **PDF Upload Configuration**")
+    uploaded_file = st.file_uploader(
+        "Choose PDF file",
+        type=['pdf'],
+        key=_wkey('pdf', element.id)
+    )
+    if uploaded_file:
+        element.config['filename'] = uploaded_file.name
+        element.config['size'] = uploaded_file.size
+        element.status = Status.READY
+        st.success(f"PDF uploaded: {uploaded_file.name}")
+
+def _render_text_input(element: WorkflowElement, index: int):
+    st.write("📝 **Text Input Configuration**")
+    label = st.text_input("Label", value="Enter text", key=_wkey('label', element.id))
+    value = st.text_area("Input Text", key=_wkey('text', element.id))
+    element.config = {'label': label, 'value': value}
+    if value:
+        element.status = Status.READY
+
+def _render_number_input(element: WorkflowElement, index: int):
+    st.write("🔢 **Number Input Configuration**")
+    label = st.text_input("Label", value="Enter number", key=_wkey('num_label', element.id))
+    value = st.number_input(label, key=_wkey('number', element.id))
+    element.config = {'label': label, 'value': value}
+    element.status = Status.READY
+
+def _render_date_input(element: WorkflowElement, index: int):
+    st.write("📅 **Date Input Configuration**")
+    label = st.text_input("Label", value="Select date", key=_wkey('date_label', element.id))
+    value = st.date_input(label, key=_wkey('date', element.id))
+    element.config = {'label': label, 'value': str(value)}
+    element.status = Status.READY
+
+def _render_checkbox(element: WorkflowElement, index: int):
+    st.write("☑️ **Checkbox Configuration**")
+    label = st.text_input("Label", value="Check option", key=_wkey('cb_label', element.id))
+    value = st.checkbox(label, key=_wkey('checkbox', element.id))
+    element.config = {'label': label, 'value': value}
+    element.status = Status.READY
+
+def _render_slider(element: WorkflowElement, index: int):
+    st.write("🎛️ **Slider Configuration**")
+    label = st.text_input("Label", value="Select value", key=_wkey('slider_label', element.id))
+    min_val = st.number_input("Min Value", value=0, key=_wkey('slider_min', element.id))
+    max_val = st.number_input("Max Value", value=100, key=_wkey('slider_max', element.id))
+    value = st.slider(label, min_value=int(min_val), max_value=int(max_val), key=_wkey('slider', element.id))
+    element.config = {'label': label, 'min': min_val, 'max': max_val, 'value': value}
+    element.status = Status.READY
+
+def _render_selectbox(element: WorkflowElement, index: int):
+    st.write("📋 **Select Box Configuration**")
+    label = st.text_input("Label", value="Choose option", key=_wkey('sb_label', element.id))
+    options_text = st.text_area("Options (one per line)", value="Option 1\nOption 2\nOption 3", key=_wkey('sb_options', element.id))
+    # Re-parse only when the textarea content changed since the last rerun
+    text_hash = hash(options_text)
+    cached = element.config.get('_options_cache')
+    if cached is not None and cached[0] == text_hash:
+        options = cached[1]
+    else:
+        options = [s for s in (line.strip() for line in options_text.splitlines()) if s]
+        element.config['_options_cache'] = (text_hash, options)
+    if options:
+        value = st.selectbox(label, options, key=_wkey('selectbox', element.id))
+        element.config.update(label=label, options=options, value=value)
+        element.status = Status.READY
+
+def _render_conditional(element: WorkflowElement, index: int):
+    st.write("🔀 **Conditional Logic Configuration**")
+    condition_type = st.selectbox("Condition Type", ["equals", "greater_than", "less_than", "contains"], key=_wkey('cond_type', element.id))
+    condition_value = st.text_input("Condition Value", key=_wkey('cond_val', element.id))
+    true_action = st.text_input("Action if True", key=_wkey('true_action', element.id))
+    false_action = st.text_input("Action if False", key=_wkey('false_action', element.id))
+    element.config = {
+        'condition_type': condition_type,
+        'condition_value': condition_value,
+        'true_action': true_action,
+        'false_action': false_action
     }
-    return names.get(element_type, element_type.title())
+    element.status = Status.READY if condition_value else Status.PENDING
+
+@st.cache_data
+def _sample_dataframe() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Column 1': [1, 2, 3],
+        'Column 2': ['A', 'B', 'C'],
+        'Column 3': [True, False, True]
+    })
+
+def _render_data_display(element: WorkflowElement, index: int):
+    st.write("📊 **Data Display Configuration**")
+    display_type = st.selectbox("Display Type", ["table", "json", "text"], key=_wkey('display_type', element.id))
+    element.config = {'display_type': display_type}
+    element.status = Status.READY
+
+    # Show sample data
+    if display_type == "table":
+        st.dataframe(_sample_dataframe())
+
+def _render_chart(element: WorkflowElement, index: int):
+    st.write("📈 **Chart Configuration**")
+    chart_type = st.selectbox("Chart Type", ["line", "bar", "scatter", "area"], key=_wkey('chart_type', element.id))
+    element.config = {'chart_type': chart_type}
+    element.status = Status.READY
+
+def _render_api_call(element: WorkflowElement, index: int):
+    st.write("🔗 **API Call Configuration**")
+    url = st.text_input("API URL", key=_wkey('api_url', element.id))
+    method = st.selectbox("Method", ["GET", "POST", "PUT", "DELETE"], key=_wkey('api_method', element.id))
+    headers = st.text_area("Headers (JSON format)", value="{}", key=_wkey('api_headers', element.id))
+    element.config = {'url': url, 'method': method, 'headers': headers}
+    # Parse headers once at config time so execution doesn't have to,
+    # and malformed JSON is caught early
+    try:
+        headers_dict = _loads(headers) if headers.strip() else {}
+        element.config['headers_parsed'] = headers_dict
+        element.status = Status.READY if url else Status.PENDING
+    except ValueError:
+        element.status = Status.ERROR
+        st.error("Headers must be valid JSON")
+
+def _render_email(element: WorkflowElement, index: int):
+    st.write("📧 **Email Configuration**")
+    recipient = st.text_input("Recipient Email", key=_wkey('email_to', element.id))
+    subject = st.text_input("Subject", key=_wkey('email_subject', element.id))
+    body = st.text_area("Email Body", key=_wkey('email_body', element.id))
+    element.config = {'recipient': recipient, 'subject': subject, 'body': body}
+    element.status = Status.READY if recipient and subject else Status.PENDING
+
+def _render_default(element: WorkflowElement, index: int):
+    st.write(f"**{get_element_display_name(element.type)} Configuration**")
+    st.info("Configuration options for this element type coming soon!")
+
+RENDER_HANDLERS = {
+    'pdf_upload': _render_pdf_upload,
+    'text_input': _render_text_input,
+    'number_input': _render_number_input,
+    'date_input': _render_date_input,
+    'checkbox': _render_checkbox,
+    'slider': _render_slider,
+    'selectbox': _render_selectbox,
+    'conditional': _render_conditional,
+    'data_display': _render_data_display,
+    'chart': _render_chart,
+    'api_call': _render_api_call,
+    'email': _render_email,
+}
 
 def render_element_config(element: WorkflowElement, index: int):
     """Render configuration for specific element types"""
-    
-    if element.type == 'pdf_upload':
-        st.write("📄 **PDF Upload Configuration**")
-        uploaded_file = st.file_uploader(
-            "Choose PDF file", 
-            type=['pdf'], 
-            key=f"pdf_{element.id}"
-        )
-        if uploaded_file:
-            element.config['filename'] = uploaded_file.name
-            element.config['size'] = uploaded_file.size
-            element.status = 'ready'
-            st.success(f"PDF uploaded: {uploaded_file.name}")
-    
-    elif element.type == 'text_input':
-        st.write("📝 **Text Input Configuration**")
-        label = st.text_input("Label", value="Enter text", key=f"label_{element.id}")
-        value = st.text_area("Input Text", key=f"text_{element.id}")
-        element.config = {'label': label, 'value': value}
-        if value:
-            element.status = 'ready'
-    
-    elif element.type == 'number_input':
-        st.write("🔢 **Number Input Configuration**")
-        label = st.text_input("Label", value="Enter number", key=f"num_label_{element.id}")
-        value = st.number_input(label, key=f"number_{element.id}")
-        element.config = {'label': label, 'value': value}
-        element.status = 'ready'
-    
-    elif element.type == 'date_input':
-        st.write("📅 **Date Input Configuration**")
-        label = st.text_input("Label", value="Select date", key=f"date_label_{element.id}")
-        value = st.date_input(label, key=f"date_{element.id}")
-        element.config = {'label': label, 'value': str(value)}
-        element.status = 'ready'
-    
-    elif element.type == 'checkbox':
-        st.write("☑️ **Checkbox Configuration**")
-        label = st.text_input("Label", value="Check option", key=f"cb_label_{element.id}")
-        value = st.checkbox(label, key=f"checkbox_{element.id}")
-        element.config = {'label': label, 'value': value}
-        element.status = 'ready'
-    
-    elif element.type == 'slider':
-        st.write("🎛️ **Slider Configuration**")
-        label = st.text_input("Label", value="Select value", key=f"slider_label_{element.id}")
-        min_val = st.number_input("Min Value", value=0, key=f"slider_min_{element.id}")
-        max_val = st.number_input("Max Value", value=100, key=f"slider_max_{element.id}")
-        value = st.slider(label, min_value=int(min_val), max_value=int(max_val), key=f"slider_{element.id}")
-        element.config = {'label': label, 'min': min_val, 'max': max_val, 'value': value}
-        element.status = 'ready'
-    
-    elif element.type == 'selectbox':
-        st.write("📋 **Select Box Configuration**")
-        label = st.text_input("Label", value="Choose option", key=f"sb_label_{element.id}")
-        options_text = st.text_area("Options (one per line)", value="Option 1\nOption 2\nOption 3", key=f"sb_options_{element.id}")
-        options = [opt.strip() for opt in options_text.split('\n') if opt.strip()]
-        if options:
-            value = st.selectbox(label, options, key=f"selectbox_{element.id}")
-            element.config = {'label': label, 'options': options, 'value': value}
-            element.status = 'ready'
-    
-    elif element.type == 'conditional':
-        st.write("🔀 **Conditional Logic Configuration**")
-        condition_type = st.selectbox("Condition Type", ["equals", "greater_than", "less_than", "contains"], key=f"cond_type_{element.id}")
-        condition_value = st.text_input("Condition Value", key=f"cond_val_{element.id}")
-        true_action = st.text_input("Action if True", key=f"true_action_{element.id}")
-        false_action = st.text_input("Action if False", key=f"false_action_{element.id}")
-        element.config = {
-            'condition_type': condition_type,
-            'condition_value': condition_value,
-            'true_action': true_action,
-            'false_action': false_action
-        }
-        element.status = 'ready' if condition_value else 'pending'
-    
-    elif element.type == 'data_display':
-        st.write("📊 **Data Display Configuration**")
-        display_type = st.selectbox("Display Type", ["table", "json", "text"], key=f"display_type_{element.id}")
-        element.config = {'display_type': display_type}
-        element.status = 'ready'
-        
-        # Show sample data
-        if display_type == "table":
-            sample_data = pd.DataFrame({
-                'Column 1': [1, 2, 3],
-                'Column 2': ['A', 'B', 'C'],
-                'Column 3': [True, False, True]
-            })
-            st.dataframe(sample_data)
-    
-    elif element.type == 'chart':
-        st.write("📈 **Chart Configuration**")
-        chart_type = st.selectbox("Chart Type", ["line", "bar", "scatter", "area"], key=f"chart_type_{element.id}")
-        element.config = {'chart_type': chart_type}
-        element.status = 'ready'
-    
-    elif element.type == 'api_call':
-        st.write("🔗 **API Call Configuration**")
-        url = st.text_input("API URL", key=f"api_url_{element.id}")
-        method = st.selectbox("Method", ["GET", "POST", "PUT", "DELETE"], key=f"api_method_{element.id}")
-        headers = st.text_area("Headers (JSON format)", value="{}", key=f"api_headers_{element.id}")
-        element.config = {'url': url, 'method': method, 'headers': headers}
-        element.status = 'ready' if url else 'pending'
-    
-    elif element.type == 'email':
-        st.write("📧 **Email Configuration**")
-        recipient = st.text_input("Recipient Email", key=f"email_to_{element.id}")
-        subject = st.text_input("Subject", key=f"email_subject_{element.id}")
-        body = st.text_area("Email Body", key=f"email_body_{element.id}")
-        element.config = {'recipient': recipient, 'subject': subject, 'body': body}
-        element.status = 'ready' if recipient and subject else 'pending'
-    
-    else:
-        st.write(f"**{get_element_display_name(element.type)} Configuration**")
-        st.info("Configuration options for this element type coming soon!")
+    handler = RENDER_HANDLERS.get(element.type, _render_default)
+    handler(element, index)
+
+def _exec_pdf_upload(element: WorkflowElement) -> str:
+    if 'filename' in element.config:
+        element.status = Status.READY
+        return f"PDF processed: {element.config['filename']}"
+    element.status = Status.ERROR
+    return "No PDF uploaded"
+
+def _exec_passthrough(element: WorkflowElement) -> str:
+    element.status = Status.READY
+    return element.config.get('value', 'No value')
+
+def _exec_conditional(element: WorkflowElement) -> str:
+    condition_met = True  # Simplified logic
+    action = element.config['true_action'] if condition_met else element.config['false_action']
+    element.status = Status.READY
+    return f"Executed: {action}"
+
+def _exec_data_display(element: WorkflowElement) -> str:
+    element.status = Status.READY
+    return "Data displayed successfully"
+
+def _exec_api_call(element: WorkflowElement) -> str:
+    element.status = Status.READY
+    return f"API call to {element.config.get('url', 'undefined')} completed"
+
+def _exec_email(element: WorkflowElement) -> str:
+    element.status = Status.READY
+    return f"Email sent to {element.config.get('recipient', 'undefined')}"
+
+def _exec_default(element: WorkflowElement) -> str:
+    element.status = Status.READY
+    return f"{element.type} executed successfully"
+
+EXEC_HANDLERS = {
+    'pdf_upload': _exec_pdf_upload,
+    **{t: _exec_passthrough for t in PASSTHROUGH_TYPES},
+    'conditional': _exec_conditional,
+    'data_display': _exec_data_display,
+    'api_call': _exec_api_call,
+    'email': _exec_email,
+}
 
 def execute_workflow():
     """Execute the workflow"""
     if not st.session_state.workflow_elements:
         st.warning("No workflow elements to execute!")
         return
-    
-    st.info("🚀 Executing workflow...")
-    
+
     results = {}
-    
-    for i, element in enumerate(st.session_state.workflow_elements):
-        element.status = 'processing'
-        
-        try:
-            # Simulate processing time
-            import time
-            time.sleep(0.5)
-            
-            # Execute element based on type
-            if element.type == 'pdf_upload':
-                if 'filename' in element.config:
-                    results[element.id] = f"PDF processed: {element.config['filename']}"
-                    element.status = 'ready'
-                else:
-                    element.status = 'error'
-                    results[element.id] = "No PDF uploaded"
-            
-            elif element.type in ['text_input', 'number_input', 'date_input', 'checkbox', 'slider', 'selectbox']:
-                results[element.id] = element.config.get('value', 'No value')
-                element.status = 'ready'
-            
-            elif element.type == 'conditional':
-                condition_met = True  # Simplified logic
-                action = element.config['true_action'] if condition_met else element.config['false_action']
-                results[element.id] = f"Executed: {action}"
-                element.status = 'ready'
-            
-            elif element.type == 'data_display':
-                results[element.id] = "Data displayed successfully"
-                element.status = 'ready'
-            
-            elif element.type == 'api_call':
-                results[element.id] = f"API call to {element.config.get('url', 'undefined')} completed"
-                element.status = 'ready'
-            
-            elif element.type == 'email':
-                results[element.id] = f"Email sent to {element.config.get('recipient', 'undefined')}"
-                element.status = 'ready'
-            
-            else:
-                results[element.id] = f"{element.type} executed successfully"
-                element.status = 'ready'
-                
-        except Exception as e:
-            element.status = 'error'
-            results[element.id] = f"Error: {str(e)}"
-    
+
+    with st.spinner("🚀 Executing workflow..."):
+        for element_id in st.session_state.workflow_order:
+            element = st.session_state.workflow_elements[element_id]
+            element.status = Status.PROCESSING
+
+            try:
+                handler = EXEC_HANDLERS.get(element.type, _exec_default)
+                results[element.id] = handler(element)
+            except Exception as e:
+                element.status = Status.ERROR
+                results[element.id] = f"Error: {str(e)}"
+
     st.session_state.execution_results = results
     st.success("✅ Workflow execution completed!")
     
     # Show results
     with st.expander("📋 Execution Results", expanded=True):
         for element_id, result in results.items():
-            element = next((e for e in st.session_state.workflow_elements if e.id == element_id), None)
+            element = st.session_state.workflow_elements.get(element_id)
             if element:
-                status_emoji = "✅" if element.status == 'ready' else "❌" if element.status == 'error' else "⏳"
+                status_emoji = "✅" if element.status == Status.READY else "❌" if element.status == Status.ERROR else "⏳"
                 st.write(f"{status_emoji} **{get_element_display_name(element.type)}**: {result}")
 
+def _dumps_bytes(obj) -> bytes:
+    """Serialize one object to JSON bytes with the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if ujson is not None:
+        return ujson.dumps(obj).encode('utf-8')
+    return json.dumps(obj).encode('utf-8')
+
 def export_workflow():
     """Export workflow to JSON"""
-    workflow_data = {
-        'elements': [element.to_dict() for element in st.session_state.workflow_elements],
-        'created_at': datetime.now().isoformat(),
-        'version': '1.0'
-    }
-    
-    json_str = json.dumps(workflow_data, indent=2)
+    # Stream one element at a time into the buffer so peak memory stays
+    # at roughly one serialized element rather than the whole workflow.
+    buf = io.BytesIO()
+    buf.write(b'{"elements":[')
+    for i, element_id in enumerate(st.session_state.workflow_order):
+        if i:
+            buf.write(b',')
+        buf.write(_dumps_bytes(st.session_state.workflow_elements[element_id].to_dict()))
+    buf.write(b'],"created_at":')
+    buf.write(_dumps_bytes(datetime.now().isoformat()))
+    buf.write(b',"version":"1.0"}')
+
     st.download_button(
         label="📥 Download Workflow JSON",
-        data=json_str,
+        data=buf.getvalue(),
         file_name=f"workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
         mime="application/json"
     )
@@ -465,19 +639,24 @@ def export_workflow():
 def import_workflow(uploaded_file):
     """Import workflow from JSON"""
     try:
-        workflow_data = json.load(uploaded_file)
+        workflow_data = _loads(uploaded_file.read())
         
         # Clear existing workflow
-        st.session_state.workflow_elements = []
-        
+        st.session_state.workflow_elements = {}
+        st.session_state.workflow_order = []
+
         # Load elements
         for element_data in workflow_data.get('elements', []):
-            element = WorkflowElement(element_data['type'], element_data['id'])
-            element.position = element_data.get('position', {'x': 0, 'y': 0})
-            element.config = element_data.get('config', {})
-            element.status = element_data.get('status', 'pending')
-            element.output = element_data.get('output')
-            st.session_state.workflow_elements.append(element)
+            element = WorkflowElement(
+                type=element_data['type'],
+                id=element_data['id'],
+                position=element_data.get('position', {'x': 0, 'y': 0}),
+                config=element_data.get('config', {}),
+                status=_coerce_status(element_data.get('status')),
+                output=element_data.get('output')
+            )
+            st.session_state.workflow_elements[element.id] = element
+            st.session_state.workflow_order.append(element.id)
         
         st.success(f"✅ Workflow imported successfully! Loaded {len(st.session_state.workflow_elements)} elements.")
         st.rerun()
@@ -485,6 +664,13 @@ def import_workflow(uploaded_file):
     except Exception as e:
         st.error(f"❌ Error importing workflow: {str(e)}")
 
+def _workflow_state_hash() -> int:
+    """Hash of the workflow content that affects derived render state"""
+    return hash(tuple(
+        (e.id, e.status, e.config.get('value'))
+        for e in st.session_state.workflow_elements.values()
+    ))
+
 def main():
     """Main application function"""
     # Create sidebar palette
@@ -497,12 +683,24 @@ def main():
     if st.session_state.workflow_elements:
         st.markdown("---")
         col1, col2, col3, col4 = st.columns(4)
-        
-        total_elements = len(st.session_state.workflow_elements)
-        ready_elements = sum(1 for e in st.session_state.workflow_elements if e.status == 'ready')
-        error_elements = sum(1 for e in st.session_state.workflow_elements if e.status == 'error')
-        pending_elements = total_elements - ready_elements - error_elements
-        
+
+        # Only recount when the workflow content actually changed;
+        # unrelated reruns reuse the figures from the previous pass
+        state_hash = _workflow_state_hash()
+        if st.session_state.get('_last_canvas_hash') != state_hash:
+            total_elements = len(st.session_state.workflow_elements)
+            counts = Counter(e.status for e in st.session_state.workflow_elements.values())
+            ready_elements = counts[Status.READY]
+            error_elements = counts[Status.ERROR]
+            pending_elements = total_elements - ready_elements - error_elements
+            st.session_state._last_canvas_hash = state_hash
+            st.session_state._canvas_stats = (
+                total_elements, ready_elements, pending_elements, error_elements
+            )
+        total_elements, ready_elements, pending_elements, error_elements = (
+            st.session_state._canvas_stats
+        )
+
         with col1:
             st.metric("Total Elements", total_elements)
         with col2: